@@ -70,6 +70,10 @@ class ApiResultError(NetworkError):
     """Raised when API results aren't as expected."""
 
 
+class EtherscanRateLimitError(NetworkError):
+    """Raised when Etherscan rate-limiting persists through all retries."""
+
+
 class SimPoolError(CurvesimException):
     """Error in a SimPool operation."""
 
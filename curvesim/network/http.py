@@ -1,14 +1,78 @@
 """
 General utility for http requests.
 """
+import asyncio
+import atexit
+import json as _json
+from typing import Any, Callable, Dict
+
 import aiohttp
 from aiohttp import ClientResponseError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random
 
 from curvesim.exceptions import HttpClientError
 
+_json_loads: Callable[..., Any]
+_json_dumps: Callable[..., str]
+
+try:
+    # Optional: parses large payloads (e.g. contract ABIs) several times
+    # faster than the stdlib, which matters since parsing runs on the
+    # event loop.  Fall back to the stdlib when not installed.
+    import orjson
+except ImportError:  # pragma: no cover
+    _json_loads = _json.loads
+    _json_dumps = _json.dumps
+else:
+    _json_loads = orjson.loads
+
+    def _orjson_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_dumps = _orjson_dumps
+
 stop_rule = stop_after_attempt(8)
-wait_rule = wait_exponential(multiplier=1.5, min=2, max=60)
+# Random jitter decorrelates retries from concurrent tasks (e.g. a
+# `gather` fan-out) so they don't all hit the server again in lockstep.
+wait_rule = wait_exponential(multiplier=1.5, min=2, max=60) + wait_random(0, 2)
+
+CONNECTION_LIMIT = 64
+"""Maximum number of simultaneous TCP connections per session."""
+
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _get_session():
+    """
+    Returns the shared client session for the running event loop.
+
+    Reusing one session keeps TCP/TLS connections alive between requests,
+    removing the handshake latency that per-request sessions pay on every
+    call.  Sessions are bound to an event loop, so one is kept per loop;
+    this matters for the "extra" loop used inside notebooks.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=CONNECTION_LIMIT),
+            headers={"Accept-Encoding": "gzip"},
+            json_serialize=_json_dumps,
+        )
+        _sessions[loop] = session
+    return session
+
+
+@atexit.register
+def _close_sessions():
+    """Close any open sessions so aiohttp doesn't complain at shutdown."""
+    for loop, session in _sessions.items():
+        if session.closed or loop.is_closed():
+            continue
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            loop.run_until_complete(session.close())
 
 
 class HTTP:
@@ -16,15 +80,15 @@ class HTTP:
     @retry(stop=stop_rule, wait=wait_rule)
     async def get(url, params=None):
 
-        kwargs = {"url": url, "headers": {"Accept-Encoding": "gzip"}}
+        kwargs = {"url": url}
 
         if params is not None:
             kwargs.update({"params": params})
 
         try:
-            async with aiohttp.request("GET", **kwargs) as resp:
+            async with _get_session().get(**kwargs) as resp:
                 resp.raise_for_status()
-                json_data = await resp.json()
+                json_data = _json_loads(await resp.read())
         except ClientResponseError as e:
             message = e.message
             status = e.status
@@ -37,15 +101,15 @@ class HTTP:
     @staticmethod
     @retry(stop=stop_rule, wait=wait_rule)
     async def post(url, json=None):
-        kwargs = {"url": url, "headers": {"Accept-Encoding": "gzip"}}
+        kwargs = {"url": url}
 
         if json is not None:
             kwargs.update({"json": json})
 
         try:
-            async with aiohttp.request("POST", **kwargs) as resp:
+            async with _get_session().post(**kwargs) as resp:
                 resp.raise_for_status()
-                json_data = await resp.json()
+                json_data = _json_loads(await resp.read())
         except ClientResponseError as e:
             message = e.message
             status = e.status
@@ -2,18 +2,102 @@
 Network connector for on-chain data
 """
 
-from asyncio import gather, sleep
+import os
+from asyncio import AbstractEventLoop, Semaphore, gather, get_running_loop, sleep
+from random import random
+from typing import Dict
 
 from web3 import AsyncHTTPProvider, Web3
 from web3.eth import AsyncEth
 
+from curvesim.exceptions import EtherscanRateLimitError
+from curvesim.logging import get_logger
 from curvesim.utils import get_env_var
 
 from .http import HTTP
 from .utils import sync
 
+logger = get_logger(__name__)
+
 ETHERSCAN_URL = "https://api.etherscan.io/api"
 
+ETHERSCAN_MAX_CONCURRENT_REQUESTS = 5
+"""Etherscan's free tier allows 5 requests per second."""
+
+_explorer_semaphores: Dict[AbstractEventLoop, Semaphore] = {}
+
+
+def _explorer_semaphore():
+    """
+    Returns the semaphore throttling concurrent explorer requests.
+
+    Semaphores are bound to an event loop, so one is kept per loop;
+    this matters for the "extra" loop used inside notebooks.
+    """
+    loop = get_running_loop()
+    semaphore = _explorer_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = Semaphore(ETHERSCAN_MAX_CONCURRENT_REQUESTS)
+        _explorer_semaphores[loop] = semaphore
+    return semaphore
+
+
+ABI_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".curvesim", "abi")
+"""Directory for the persistent on-disk ABI cache."""
+
+_abi_memory_cache: Dict[str, str] = {}
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+"""Canonical Multicall3 deployment on Ethereum mainnet."""
+
+MULTICALL3_ABI = """
+[{"inputs":
+    [{"components":
+        [{"name": "target", "type": "address"},
+         {"name": "allowFailure", "type": "bool"},
+         {"name": "callData", "type": "bytes"}],
+      "name": "calls",
+      "type": "tuple[]"}],
+  "name": "aggregate3",
+  "outputs":
+    [{"components":
+        [{"name": "success", "type": "bool"},
+         {"name": "returnData", "type": "bytes"}],
+      "name": "returnData",
+      "type": "tuple[]"}],
+  "stateMutability": "payable",
+  "type": "function"}]
+"""
+
+# 4-byte selectors for the zero-arg getters used to detect the underlying
+# coin of a lending token (aToken, cToken, or yToken).
+UNDERLYING_SELECTORS = {
+    "underlying()": bytes.fromhex("6f307dc3"),
+    "token()": bytes.fromhex("fc0c546a"),
+    "UNDERLYING_ASSET_ADDRESS()": bytes.fromhex("b16a19de"),
+}
+
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")  # decimals()
+
+AAVE_PROXY_ABI = """
+[{"inputs": [],
+  "name": "UNDERLYING_ASSET_ADDRESS",
+  "outputs": [{"name": "", "type": "address"}],
+  "stateMutability": "view",
+  "type": "function"},
+ {"inputs": [],
+  "name": "decimals",
+  "outputs": [{"name": "", "type": "uint8"}],
+  "stateMutability": "view",
+  "type": "function"}]
+"""
+"""
+The two getters used on Aave's aToken proxy (implementation at
+0x1C050bCa8BAbe53Ef769d0d2e411f556e1a27E7B).  The implementation ABI is
+static, so bundling this fragment avoids a guaranteed Etherscan
+round-trip per aToken.
+"""
+
 
 def get_etherscan_api_key():
     """
@@ -35,7 +119,7 @@ def get_alchemy_api_key():
     return key
 
 
-async def explorer(params):
+async def explorer(params, max_retries=8):
     """
     Async function to retrieve data from the chain explorer (Etherscan).
 
@@ -43,44 +127,96 @@ async def explorer(params):
     ----------
     params : dict
         Must include keys for module, action, and any required arguments for the query.
+    max_retries : int, optional
+        Number of attempts made while Etherscan reports rate limiting.
 
     Returns
     -------
     dict
         Query result
 
+    Raises
+    ------
+    EtherscanRateLimitError
+        If rate limiting persists through all retries.  Retries used to
+        loop forever, which silently hung every sibling task gathered
+        with the query (e.g. with a misconfigured API key).
+
     """
     etherscan_api_key = get_etherscan_api_key()
     params.update({"apikey": etherscan_api_key})
 
+    semaphore = _explorer_semaphore()
+
     t_wait = 0.2
-    while True:
-        r = await HTTP.get(ETHERSCAN_URL, params=params)
+    for attempt in range(max_retries):
+        async with semaphore:
+            r = await HTTP.get(ETHERSCAN_URL, params=params)
         result = r["result"]
 
-        if result.startswith("Max rate limit reached"):
-            await sleep(t_wait)
-            t_wait = round(t_wait * 1.5, 2)
-        else:
-            break
+        rate_limited = isinstance(result, str) and result.startswith(
+            "Max rate limit reached"
+        )
+        if not rate_limited:
+            return result
+
+        logger.debug(
+            "Etherscan rate limit hit (attempt %d/%d); backing off.",
+            attempt + 1,
+            max_retries,
+        )
+        # Jitter the backoff so concurrently gathered tasks don't
+        # all retry at the same moment.
+        await sleep(t_wait * (1 + random()))
+        t_wait = round(t_wait * 1.5, 2)
+
+    raise EtherscanRateLimitError(
+        f"Etherscan rate limit persisted through {max_retries} attempts."
+    )
 
-    return result
 
+def _abi_cache_path(address):
+    return os.path.join(ABI_CACHE_DIR, address.lower() + ".json")
 
-async def ABI(address):
+
+async def ABI(address, force_refresh=False):
     """
     Async function to retrieves ABI from the chain explorer (Etherscan).
 
+    ABIs are immutable once a contract is deployed, so results are kept
+    in a persistent on-disk cache (under :data:`ABI_CACHE_DIR`) as well
+    as in memory; repeated runs skip the Etherscan round-trip and its
+    rate limiter entirely.
+
     Parameters
     ----------
     address : str
         Address for the contract on Ethereum mainnet.
+    force_refresh : bool, optional
+        Bypass the cache and overwrite any cached entry.
 
     Returns
     -------
     abi : str
 
     """
+    key = address.lower()
+
+    if not force_refresh:
+        abi = _abi_memory_cache.get(key)
+        if abi:
+            return abi
+
+        try:
+            with open(_abi_cache_path(address), "r", encoding="utf-8") as f:
+                abi = f.read()
+        except OSError:
+            abi = None
+
+        if abi:
+            _abi_memory_cache[key] = abi
+            return abi
+
     p = {
         "module": "contract",
         "action": "getabi",
@@ -89,19 +225,33 @@ async def ABI(address):
 
     abi = await explorer(p)
 
+    # Don't cache explorer error strings, e.g. for unverified contracts.
+    if abi.startswith("["):
+        _abi_memory_cache[key] = abi
+        try:
+            os.makedirs(ABI_CACHE_DIR, exist_ok=True)
+            with open(_abi_cache_path(address), "w", encoding="utf-8") as f:
+                f.write(abi)
+        except OSError as e:
+            logger.debug("Couldn't write ABI cache file: %s", e)
+
     return abi
 
 
 _web3 = None
 
 
-def _load_web3():
+def _rpc_url():
     alchemy_api_key = get_alchemy_api_key()
+    return f"https://eth-mainnet.g.alchemy.com/v2/{alchemy_api_key}"
+
+
+def _load_web3():
     global _web3  # pylint: disable=global-statement
     if not _web3:
         _web3 = Web3(
             AsyncHTTPProvider(
-                f"https://eth-mainnet.g.alchemy.com/v2/{alchemy_api_key}",
+                _rpc_url(),
                 request_kwargs={"headers": {"Accept-Encoding": "gzip"}},
             ),
             modules={"eth": (AsyncEth,)},
@@ -110,6 +260,42 @@ def _load_web3():
     return _web3
 
 
+async def _batch_eth_call(calls):
+    """
+    Async function to execute many `eth_call`s in one JSON-RPC batch request.
+
+    Parameters
+    ----------
+    calls : list of (str, bytes)
+        Pairs of contract address and calldata, one per call.
+
+    Returns
+    -------
+    list of (bytes or None)
+        Return data for each call, in order; `None` for calls that
+        reverted or returned nothing.
+
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": k,
+            "method": "eth_call",
+            "params": [{"to": address, "data": "0x" + calldata.hex()}, "latest"],
+        }
+        for k, (address, calldata) in enumerate(calls)
+    ]
+
+    responses = await HTTP.post(_rpc_url(), json=payload)
+
+    results = [None] * len(calls)
+    for response in responses:
+        result = response.get("result")
+        if result and result != "0x":
+            results[response["id"]] = bytes.fromhex(result[2:])
+    return results
+
+
 async def contract(address, abi=None):
     """
     Creates an async Web3py contract object.
@@ -133,20 +319,19 @@ async def contract(address, abi=None):
 async def _underlying_coin_info(address):
     c = await contract(address)
 
-    fns = ["upgradeToAndCall", "underlying", "token"]
-    n_fns = len(fns) - 1
+    # Set membership against the parsed ABI is O(1) per candidate, versus
+    # constructing and scanning dir(c.functions) for each one.
+    fn_set = {entry["name"] for entry in c.abi if entry.get("type") == "function"}
 
-    for i, fn in enumerate(fns):
-        if fn in dir(c.functions):
+    for fn in ["upgradeToAndCall", "underlying", "token"]:
+        if fn in fn_set:
             break
-
-        if i == n_fns:
-            raise ValueError(f"Could not find underlying token for {address}")
+    else:
+        raise ValueError(f"Could not find underlying token for {address}")
 
     # Handle Aave proxy
     if fn == "upgradeToAndCall":
-        abi = await ABI("0x1C050bCa8BAbe53Ef769d0d2e411f556e1a27E7B")
-        c = await contract(address, abi)
+        c = await contract(address, AAVE_PROXY_ABI)
         fn = "UNDERLYING_ASSET_ADDRESS"
 
     address, decimals = await gather(
@@ -156,11 +341,108 @@ async def _underlying_coin_info(address):
     return address, decimals
 
 
+async def _multicall_underlying_coin_info(addresses):
+    """
+    Async function to resolve underlying coin addresses and lending-token
+    decimals for all `addresses` in a single Multicall3 `aggregate3` call.
+
+    For each address, the three candidate getters in
+    :data:`UNDERLYING_SELECTORS` are probed along with `decimals()`; the
+    first successful probe wins.  This needs one `eth_call` round-trip in
+    total and no ABI fetches at all.
+
+    Parameters
+    ----------
+    addresses : list of str
+        Addresses for the lending tokens on Ethereum mainnet.
+
+    Returns
+    -------
+    addrs : list of str
+        The addresses of the underlying tokens.
+    decimals : list of int
+        The decimals of the lending tokens.
+
+    """
+    w3 = _load_web3()
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    selectors = list(UNDERLYING_SELECTORS.values()) + [DECIMALS_SELECTOR]
+    calls = [
+        (address, True, selector) for address in addresses for selector in selectors
+    ]
+
+    results = await multicall.functions.aggregate3(calls).call()
+    returns = [data if success else None for success, data in results]
+
+    return _decode_underlying_returns(addresses, returns, len(selectors))
+
+
+async def _jsonrpc_underlying_coin_info(addresses):
+    """
+    Async function to resolve underlying coin addresses and lending-token
+    decimals for all `addresses` in one JSON-RPC batch of `eth_call`s.
+
+    Same probing scheme as `_multicall_underlying_coin_info`, for
+    providers where Multicall3 isn't usable.
+
+    Parameters
+    ----------
+    addresses : list of str
+        Addresses for the lending tokens on Ethereum mainnet.
+
+    Returns
+    -------
+    addrs : list of str
+        The addresses of the underlying tokens.
+    decimals : list of int
+        The decimals of the lending tokens.
+
+    """
+    selectors = list(UNDERLYING_SELECTORS.values()) + [DECIMALS_SELECTOR]
+    calls = [(address, selector) for address in addresses for selector in selectors]
+
+    returns = await _batch_eth_call(calls)
+
+    return _decode_underlying_returns(addresses, returns, len(selectors))
+
+
+def _decode_underlying_returns(addresses, returns, n_slots):
+    """
+    Decodes the probe returns produced for each address by the batched
+    underlying-coin lookups: the first successful address-sized probe
+    wins, and the last slot holds the lending token's `decimals()`.
+    """
+    addrs = []
+    decimals = []
+    for k, address in enumerate(addresses):
+        address_returns = returns[k * n_slots : (k + 1) * n_slots]
+
+        underlying = None
+        for data in address_returns[:-1]:
+            if data is not None and len(data) == 32:
+                underlying = Web3.to_checksum_address(data[-20:])
+                break
+
+        data = address_returns[-1]
+        if underlying is None or not data:
+            raise ValueError(f"Could not find underlying token for {address}")
+
+        addrs.append(underlying)
+        decimals.append(int.from_bytes(data, "big"))
+
+    return addrs, decimals
+
+
 async def underlying_coin_info(addresses):
     """
     Async function to get the underlying coin addresses for lending tokens
     (aTokens, cTokens, and yTokens).
 
+    The lookup is batched through Multicall3 when possible, then through
+    a JSON-RPC batch of raw `eth_call`s, with the per-address ABI probing
+    kept as a last-resort fallback.
+
     Parameters
     ----------
     addresses : iterable of str
@@ -172,10 +454,25 @@ async def underlying_coin_info(addresses):
         The addresses of the underlying tokens.
 
     """
-    if isinstance(addresses, str):
-        addrs, decimals = await _underlying_coin_info(addresses)
-
+    single = isinstance(addresses, str)
+    if single:
+        addresses = [addresses]
     else:
+        addresses = list(addresses)
+
+    addrs = None
+    decimals = None
+    for resolver in (_multicall_underlying_coin_info, _jsonrpc_underlying_coin_info):
+        try:
+            addrs, decimals = await resolver(addresses)
+            break
+        except Exception as e:  # pylint: disable=broad-except
+            # e.g. Multicall3 not deployed on the target chain, a provider
+            # that rejects batches, or an unresolvable probe; fall through
+            # to the next strategy.
+            logger.debug("%s failed, falling back: %s", resolver.__name__, e)
+
+    if addrs is None:
         tasks = []
         for address in addresses:
             tasks.append(_underlying_coin_info(address))
@@ -183,6 +480,9 @@ async def underlying_coin_info(addresses):
         response = await gather(*tasks)
         addrs, decimals = map(list, zip(*response))
 
+    if single:
+        return addrs[0], decimals[0]
+
     return addrs, decimals
 
 
@@ -566,6 +566,56 @@ class CurveCryptoPool(Pool):  # pylint: disable=too-many-instance-attributes
         y, _ = get_y(A, gamma, xp, D, j)
         return y
 
+    # pylint: disable-next=too-many-arguments
+    def get_y_vec(
+        self, i: int, j: int, xs: List[int], xp: List[int], D: Optional[int] = None
+    ) -> List[int]:
+        """
+        Batched version of `get_y`: calculate x[j] for each value of x[i]
+        in `xs`.
+
+        The invariant `D` is solved once and reused across all points,
+        instead of being recomputed per call as `get_y` does; callers
+        that already know the invariant for `xp` can pass it in and skip
+        that solve as well.
+
+        Parameters
+        ----------
+        i: int
+            index of coin; usually the "in"-token
+        j: int
+            index of coin; usually the "out"-token
+        xs: iterable of int
+            balances of i-th coin in units of `D`
+        xp: list of int
+            coin balances in units of `D`
+        D: int, optional
+            the invariant for `xp`, if already computed
+
+        Returns
+        -------
+        list of int
+            The balance of the j-th coin, in units of `D`, for each value
+            in `xs`.
+
+        Note
+        ----
+        This is a "view" function; it doesn't change the state of the pool.
+        """
+        A: int = self.A
+        gamma: int = self.gamma
+        if D is None:
+            D = newton_D(A, gamma, xp)
+
+        xp = xp.copy()
+
+        ys: List[int] = []
+        for x in xs:
+            xp[i] = x
+            y, _ = get_y(A, gamma, xp, D, j)
+            ys.append(y)
+        return ys
+
     def _fee(self, xp: List[int]) -> int:
         """
         f = fee_gamma / (fee_gamma + (1 - K))
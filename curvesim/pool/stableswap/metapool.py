@@ -10,6 +10,7 @@ from curvesim.exceptions import CurvesimValueError
 from curvesim.pool.snapshot import CurveMetaPoolBalanceSnapshot, Snapshot
 
 from ..base import Pool
+from .pool import _newton_y
 
 
 class CurveMetaPool(Pool):  # pylint: disable=too-many-instance-attributes
@@ -273,22 +274,57 @@ class CurveMetaPool(Pool):  # pylint: disable=too-many-instance-attributes
         """  # noqa
         xx = xp[:]
         D = self.D(xx)
-        D = mpz(D)
         xx[i] = x  # x is quantity of underlying asset brought to 1e18 precision
-        xx = [xx[k] for k in range(self.n) if k != j]
-        Ann = self.A * self.n
-        c = D
-        for y in xx:
-            c = c * D // (y * self.n)
-        c = c * D // (self.n * Ann)
-        b = sum(xx) + D // Ann - D
-        y_prev = 0
-        y = D
-        while abs(y - y_prev) > 1:
-            y_prev = y
-            y = (y**2 + c) // (2 * y + b)
-        y = int(y)
-        return y  # result is in units for D
+        n = self.n
+        xx = [xx[k] for k in range(n) if k != j]
+        return _newton_y(self.A * n, n, D, xx)  # result is in units for D
+
+    # pylint: disable-next=too-many-arguments
+    def get_y_vec(self, i, j, xs, xp, D=None):
+        """
+        Batched version of `get_y`: calculate x[j] for each value of x[i]
+        in `xs`.
+
+        The invariant `D` is solved once and reused across all points,
+        instead of being recomputed per call as `get_y` does; callers
+        that already know the invariant for `xp` can pass it in and skip
+        that solve as well.
+
+        Parameters
+        ----------
+        i: int
+            index of coin; usually the "in"-token
+        j: int
+            index of coin; usually the "out"-token
+        xs: iterable of int
+            balances of i-th coin in units of D
+        xp: list of int
+            coin balances in units of D
+        D: int, optional
+            the invariant for `xp`, if already computed
+
+        Returns
+        -------
+        list of int
+            The balance of the j-th coin, in units of D, for each value
+            in `xs`.
+
+        Note
+        ----
+        This is a "view" function; it doesn't change the state of the pool.
+        """
+        n = self.n
+        if D is None:
+            D = self.D(xp)
+        Ann = self.A * n
+        xx = [xp[k] for k in range(n) if k != j]
+        x_index = i if i < j else i - 1
+
+        ys = []
+        for x in xs:
+            xx[x_index] = x
+            ys.append(_newton_y(Ann, n, D, xx))
+        return ys
 
     def get_y_D(self, A, i, xp, D):
         """
@@ -316,22 +352,9 @@ class CurveMetaPool(Pool):  # pylint: disable=too-many-instance-attributes
         ----
         This is a "view" function; it doesn't change the state of the pool.
         """
-        D = mpz(D)
-        xx = [xp[k] for k in range(self.n) if k != i]
-        S = sum(xx)
-        Ann = A * self.n
-        c = D
-        for y in xx:
-            c = c * D // (y * self.n)
-        c = c * D // (self.n * Ann)
-        b = S + D // Ann
-        y_prev = 0
-        y = D
-        while abs(y - y_prev) > 1:
-            y_prev = y
-            y = (y**2 + c) // (2 * y + b - D)
-        y = int(y)
-        return y  # result is in units for D
+        n = self.n
+        xx = [xp[k] for k in range(n) if k != i]
+        return _newton_y(A * n, n, D, xx)  # result is in units for D
 
     def exchange(self, i, j, dx):
         """
@@ -12,6 +12,46 @@ from curvesim.pool.snapshot import CurvePoolBalanceSnapshot, Snapshot
 from ..base import Pool
 
 
+def _newton_y(Ann, n, D, xx):
+    """
+    Newton's method solver for the stableswap quadratic in one coin balance.
+
+    Parameters
+    ----------
+    Ann: int
+        Amplification coefficient times number of coins, i.e. :math:`A n`.
+    n: int
+        number of coins
+    D: int
+        The stableswap invariant.
+    xx: list of int
+        Balances, in units of D, of all coins except the one being
+        solved for, in their original index order.
+
+    Returns
+    -------
+    int
+        The balance of the solved-for coin, in units of D.
+
+    Note
+    ----
+    This is shared by `get_y` and `get_y_D` on the pool classes and by the
+    batched `get_y_vec`, which reuses one invariant across many solves.
+    """
+    D = mpz(D)
+    c = D
+    for y in xx:
+        c = c * D // (y * n)
+    c = c * D // (n * Ann)
+    b = sum(xx) + D // Ann - D
+    y_prev = 0
+    y = D
+    while abs(y - y_prev) > 1:
+        y_prev = y
+        y = (y**2 + c) // (2 * y + b)
+    return int(y)
+
+
 class CurvePool(Pool):  # pylint: disable=too-many-instance-attributes
     """
     Basic stableswap implementation in Python.
@@ -259,23 +299,57 @@ class CurvePool(Pool):  # pylint: disable=too-many-instance-attributes
         """  # noqa
         xx = xp[:]
         D = self.D(xx)
-        D = mpz(D)
         xx[i] = x  # x is quantity of underlying asset brought to 1e18 precision
         n = self.n
         xx = [xx[k] for k in range(n) if k != j]
+        return _newton_y(self.A * n, n, D, xx)  # result is in units for D
+
+    # pylint: disable-next=too-many-arguments
+    def get_y_vec(self, i, j, xs, xp, D=None):
+        """
+        Batched version of `get_y`: calculate x[j] for each value of x[i]
+        in `xs`.
+
+        The invariant `D` is solved once and reused across all points,
+        instead of being recomputed per call as `get_y` does; callers
+        that already know the invariant for `xp` can pass it in and skip
+        that solve as well.
+
+        Parameters
+        ----------
+        i: int
+            index of coin; usually the "in"-token
+        j: int
+            index of coin; usually the "out"-token
+        xs: iterable of int
+            balances of i-th coin in units of D
+        xp: list of int
+            coin balances in units of D
+        D: int, optional
+            the invariant for `xp`, if already computed
+
+        Returns
+        -------
+        list of int
+            The balance of the j-th coin, in units of D, for each value
+            in `xs`.
+
+        Note
+        ----
+        This is a "view" function; it doesn't change the state of the pool.
+        """
+        n = self.n
+        if D is None:
+            D = self.D(xp)
         Ann = self.A * n
-        c = D
-        for y in xx:
-            c = c * D // (y * n)
-        c = c * D // (n * Ann)
-        b = sum(xx) + D // Ann - D
-        y_prev = 0
-        y = D
-        while abs(y - y_prev) > 1:
-            y_prev = y
-            y = (y**2 + c) // (2 * y + b)
-        y = int(y)
-        return y  # result is in units for D
+        xx = [xp[k] for k in range(n) if k != j]
+        x_index = i if i < j else i - 1
+
+        ys = []
+        for x in xs:
+            xx[x_index] = x
+            ys.append(_newton_y(Ann, n, D, xx))
+        return ys
 
     def get_y_D(self, A, i, xp, D):
         """
@@ -303,23 +377,9 @@ class CurvePool(Pool):  # pylint: disable=too-many-instance-attributes
         ----
         This is a "view" function; it doesn't change the state of the pool.
         """
-        D = mpz(D)
         n = self.n
         xx = [xp[k] for k in range(n) if k != i]
-        S = sum(xx)
-        Ann = A * n
-        c = D
-        for y in xx:
-            c = c * D // (y * n)
-        c = c * D // (n * Ann)
-        b = S + D // Ann
-        y_prev = 0
-        y = D
-        while abs(y - y_prev) > 1:
-            y_prev = y
-            y = (y**2 + c) // (2 * y + b - D)
-        y = int(y)
-        return y  # result is in units for D
+        return _newton_y(A * n, n, D, xx)  # result is in units for D
 
     def exchange(self, i, j, dx):
         """
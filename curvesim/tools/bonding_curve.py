@@ -3,28 +3,46 @@ Contains the bonding_curve function, which computes a pool's bonding
 curve and current reserves for each pair of coins and optionally
 plots the curves using Matplotlib.
 """
-from itertools import combinations
-from typing import Dict, List, Tuple, Union
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, repeat
+from typing import Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 from numpy import linspace
 
 from curvesim.pool import CurveCryptoPool, CurveMetaPool, CurvePool, CurveRaiPool
 
 D_UNIT = 10**18
 
+_D_UNIT_FLOAT = float(D_UNIT)
+"""
+Float divisor for vectorized denormalization.  10**18 is exactly
+representable in binary floating point, so dividing by it rounds only
+once and matches Python's int division bit-for-bit; multiplying by the
+reciprocal 1e-18 (which is *not* exactly representable) would perturb
+results by 1 ulp.
+"""
+
 Stableswap = Union[CurvePool, CurveMetaPool, CurveRaiPool]
 Cryptoswap = Union[CurveCryptoPool]
 
 IndexPair = Tuple[int, int]
-NormalizedPoint = Tuple[int, int]
 Point = Tuple[float, float]
+Curve = Union[List[Point], np.ndarray]
 
 
 # pylint: disable-next=too-many-locals
 def bonding_curve(  # noqa: C901
-    pool: Union[Stableswap, Cryptoswap], *, truncate=None, resolution=1000, plot=False
-) -> Dict[IndexPair, List[Point]]:
+    pool: Union[Stableswap, Cryptoswap],
+    *,
+    truncate=None,
+    resolution=1000,
+    plot=False,
+    return_ndarray=False,
+    n_workers=1,
+) -> Dict[IndexPair, Curve]:
     """
     Computes and optionally plots a pool's bonding curve and current reserves.
 
@@ -44,12 +62,26 @@ def bonding_curve(  # noqa: C901
     plot : bool, optional (default=False)
         Plots the bonding curves using Matplotlib.
 
+    return_ndarray : bool, optional (default=False)
+        Return each curve as a float64 ndarray of shape (2, resolution),
+        with the reserves for the first and second coin as rows, instead of
+        a list of pairs.  The contiguous layout is far more compact than a
+        list of tuples and plots without conversion.
+
+    n_workers : int, optional (default=1)
+        Number of worker processes used to compute the coin pairs, which
+        are independent of each other.  The default computes everything in
+        the calling process; values above 1 are only worthwhile for pools
+        with several pairs at high resolution, since each worker receives
+        its own copy of the pool.
+
     Returns
     -------
     pair_to_curve : dict
         Dictionary with coin index pairs as keys and lists of corresponding reserves
         as values. Each list of reserves is a list of pairs, where each pair consists
         of the reserves for the first and second coin of the corresponding pair.
+        With `return_ndarray`, each value is a (2, resolution) ndarray instead.
 
     Example
     --------
@@ -88,32 +120,56 @@ def bonding_curve(  # noqa: C901
     else:
         raise TypeError(f"Bonding curve calculation not supported for {type(pool)}")
 
-    pair_to_curve: Dict[IndexPair, List[Point]] = {}
-    current_points: Dict[IndexPair, Point] = {}
-    for (i, j) in combos:
-        truncated_D: int = int(D * truncate)
-        x_limit: int = pool.get_y(j, i, truncated_D, xp)
-        xs: List[int] = list(
-            map(int, linspace(truncated_D, x_limit, resolution).round())
-        )
-
-        curve: List[Point] = []
-        for x in xs:
-            y: int = pool.get_y(i, j, x, xp)
-            x_float, y_float = _denormalize((x, y), (i, j), pool)
+    is_stableswap: bool = isinstance(pool, (CurveMetaPool, CurvePool, CurveRaiPool))
+    truncated_D: int = int(D * truncate)
+
+    # For Stableswap, `D` was just solved from this same `xp`, so every
+    # endpoint and curve solve can reuse it.  Cryptoswap's `D` attribute
+    # is kept as-is for the truncation domain (see above), but isn't the
+    # solution for `xp`, so the solver derives its own invariant there.
+    solver_D: Optional[int] = D if is_stableswap else None
+
+    x_limits: Dict[IndexPair, int] = {
+        (i, j): pool.get_y_vec(j, i, [truncated_D], xp, D=solver_D)[0]
+        for (i, j) in combos
+    }
+
+    # Each pair's curve is independent, so they can be computed in
+    # parallel; each worker process gets its own copy of the pool.
+    n_workers = min(n_workers, len(combos), multiprocessing.cpu_count())
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            curves = list(
+                executor.map(
+                    _compute_pair_curve,
+                    repeat(pool),
+                    combos,
+                    (x_limits[pair] for pair in combos),
+                    repeat(truncated_D),
+                    repeat(resolution),
+                    repeat(solver_D),
+                )
+            )
+    else:
+        curves = [
+            _compute_pair_curve(
+                pool, pair, x_limits[pair], truncated_D, resolution, solver_D
+            )
+            for pair in combos
+        ]
 
-            curve.append((x_float, y_float))
+    pair_to_curve: Dict[IndexPair, Curve] = _assemble_curves(
+        combos, curves, resolution, return_ndarray
+    )
 
-        pair_to_curve[(i, j)] = curve
+    current_points: Dict[IndexPair, Point] = {}
+    for (i, j) in combos:
+        x_factor, y_factor = _unit_factors((i, j), pool)
 
         current_x: int = xp[i]
         current_y: int = xp[j]
 
-        current_x_float, current_y_float = _denormalize(
-            (current_x, current_y), (i, j), pool
-        )
-
-        current_points[(i, j)] = (current_x_float, current_y_float)
+        current_points[(i, j)] = (current_x / x_factor, current_y / y_factor)
 
     if plot:
         labels: List[str] = pool.coin_names
@@ -125,16 +181,78 @@ def bonding_curve(  # noqa: C901
     return pair_to_curve
 
 
-def _denormalize(
-    normalized_point: NormalizedPoint,
-    index_pair: IndexPair,
+def _assemble_curves(
+    combos: List[IndexPair],
+    curves: List[Tuple[List[float], List[float]]],
+    resolution: int,
+    return_ndarray: bool,
+) -> Dict[IndexPair, Curve]:
+    """
+    Collects the computed pair curves into the returned dict, in either
+    the list-of-points or ndarray layout.
+    """
+    pair_to_curve: Dict[IndexPair, Curve] = {}
+
+    if return_ndarray:
+        # One contiguous (n_pairs, 2, resolution) tensor holding every
+        # curve; the returned dict is a thin per-pair view into it, so
+        # downstream array code can process all pairs in a single pass.
+        curve_tensor: np.ndarray = np.empty((len(combos), 2, resolution))
+        for k, (pair, (xs_denorm, ys_denorm)) in enumerate(zip(combos, curves)):
+            curve_tensor[k, 0] = xs_denorm
+            curve_tensor[k, 1] = ys_denorm
+            pair_to_curve[pair] = curve_tensor[k]
+    else:
+        for pair, (xs_denorm, ys_denorm) in zip(combos, curves):
+            pair_to_curve[pair] = list(zip(xs_denorm, ys_denorm))
+
+    return pair_to_curve
+
+
+# pylint: disable-next=too-many-arguments
+def _compute_pair_curve(
     pool: Union[Stableswap, Cryptoswap],
-) -> Point:
+    index_pair: IndexPair,
+    x_limit: int,
+    truncated_D: int,
+    resolution: int,
+    solver_D: Optional[int] = None,
+) -> Tuple[List[float], List[float]]:
     """
-    Converts a point made of integer balances (as if following EVM rules) to
-    human-readable float form.
+    Computes one pair's denormalized bonding curve.
+
+    Module-level so it can be dispatched to worker processes; everything
+    it takes and returns is picklable.
+    """
+    i, j = index_pair
+    xp: List[int] = pool._xp()  # pylint: disable=protected-access
+
+    xs_float: np.ndarray = linspace(truncated_D, x_limit, resolution).round()
+    # `tolist` yields Python floats in one pass, rather than boxing a
+    # numpy scalar per element during iteration.  An int64 array is not
+    # an option: balances in units of D (~1e26) overflow int64.
+    xs: List[int] = list(map(int, xs_float.tolist()))
+
+    # Rounding collapses adjacent samples onto the same integer when
+    # `resolution` exceeds the grid's span; solve each distinct x once
+    # and fan the results back out.
+    unique_xs: List[int] = list(dict.fromkeys(xs))
+    if len(unique_xs) < len(xs):
+        y_by_x = dict(zip(unique_xs, pool.get_y_vec(i, j, unique_xs, xp, D=solver_D)))
+        ys: List[int] = [y_by_x[x] for x in xs]
+    else:
+        ys = pool.get_y_vec(i, j, xs, xp, D=solver_D)
+
+    return _denormalize_curve(xs, xs_float, ys, *_unit_factors(index_pair, pool))
+
+
+def _unit_factors(
+    index_pair: IndexPair, pool: Union[Stableswap, Cryptoswap]
+) -> Tuple[int, int]:
+    """
+    Returns the integer factors dividing out the normalized (EVM-style)
+    balances for each coin of the given index pair.
     """
-    x, y = normalized_point
     i, j = index_pair
 
     assert i != j  # dev: x and y axes must use coins of different indices
@@ -146,15 +264,45 @@ def _denormalize(
         x_factor = D_UNIT if i == 0 else pool.price_scale[i - 1]
         y_factor = D_UNIT if j == 0 else pool.price_scale[j - 1]
 
-    x_float: float = x / x_factor
-    y_float: float = y / y_factor
-    point: Point = (x_float, y_float)
+    return x_factor, y_factor
+
+
+def _denormalize_curve(
+    xs: List[int],
+    xs_float: np.ndarray,
+    ys: List[int],
+    x_factor: int,
+    y_factor: int,
+) -> Tuple[List[float], List[float]]:
+    """
+    Converts a whole curve of integer balances (as if following EVM rules)
+    to human-readable float form in a few batch operations, returning the
+    denormalized x and y coordinates as separate lists.
+
+    The unit factors and pool-type checks are resolved by the caller, once
+    per curve instead of once per point.  The x-coordinates come from
+    `linspace`, so they are exactly representable as floats; when the unit
+    factor is `D_UNIT` (also exact in binary floating point), a single
+    vectorized divide reproduces Python's correctly rounded int division
+    bit-for-bit.
+
+    The y-coordinates are arbitrary-precision ints from `get_y`, which can
+    exceed float precision, so they keep the correctly rounded big-int
+    division per point.  Cryptoswap price scales can exceed 2**53 as well
+    and are handled the same way.
+    """
+    if x_factor == D_UNIT:
+        xs_denorm: List[float] = (xs_float / _D_UNIT_FLOAT).tolist()
+    else:
+        xs_denorm = [x / x_factor for x in xs]
+
+    ys_denorm: List[float] = [y / y_factor for y in ys]
 
-    return point
+    return xs_denorm, ys_denorm
 
 
 def _plot_bonding_curve(
-    pair_to_curve: Dict[IndexPair, List[Point]],
+    pair_to_curve: Dict[IndexPair, Curve],
     current_points: Dict[IndexPair, Point],
     labels: List[str],
 ) -> None:
@@ -164,8 +312,11 @@ def _plot_bonding_curve(
         axs = [axs]
 
     for pair, ax in zip(pair_to_curve, axs):
-        curve: List[Point] = pair_to_curve[pair]
-        xs, ys = zip(*curve)
+        curve: Curve = pair_to_curve[pair]
+        if isinstance(curve, np.ndarray):
+            xs, ys = curve  # SoA rows plot without any conversion
+        else:
+            xs, ys = zip(*curve)
         ax.plot(xs, ys, color="black")  # the entire bonding curve
 
         i, j = pair
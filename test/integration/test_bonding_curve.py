@@ -144,3 +144,19 @@ def test_bonding_curve_cryptoswap():
     }
 
     assert pair_to_curve == expected_result
+
+
+def test_bonding_curve_ndarray():
+    """Test that the ndarray output option matches the default output."""
+    A = 2000
+    balances = [96930673769101734848937206, 96029665968769, 94203880672841]
+    rates = [10**18, 10**30, 10**30]
+    pool = curvesim.pool.make(A, balances, 3, rates=rates)
+    pair_to_curve = bonding_curve(pool, resolution=5)
+    pair_to_arrays = bonding_curve(pool, resolution=5, return_ndarray=True)
+
+    assert pair_to_curve.keys() == pair_to_arrays.keys()
+    for pair, curve in pair_to_curve.items():
+        array = pair_to_arrays[pair]
+        assert array.shape == (2, 5)
+        assert list(zip(array[0].tolist(), array[1].tolist())) == curve
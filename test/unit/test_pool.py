@@ -137,6 +137,24 @@ def test_get_y(vyper_3pool, mainnet_3pool_state):
     assert y == expected_y
 
 
+def test_get_y_vec():
+    """
+    Test the batched solver against scalar `get_y`, with and without a
+    precomputed invariant.
+    """
+    pool = CurvePool(2000, D=[178 * 10**24, 465 * 10**24, 256 * 10**24], n=3)
+    virtual_balances = pool._xp()  # pylint: disable=protected-access
+    D = pool.D(virtual_balances)
+
+    i = 0
+    j = 1
+    xs = [virtual_balances[i] * k // 7 for k in range(1, 8)]
+    expected_ys = [pool.get_y(i, j, x, virtual_balances) for x in xs]
+
+    assert pool.get_y_vec(i, j, xs, virtual_balances) == expected_ys
+    assert pool.get_y_vec(i, j, xs, virtual_balances, D=D) == expected_ys
+
+
 def test_get_y_D(vyper_3pool):
     """Test y calculation against vyper implementation"""
 